@@ -2,141 +2,16 @@
 """CLI entry point for Linear to Excel Planning Tool."""
 
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from operator import itemgetter
 
 import click
 
-from src.linear_api import fetch_teams, fetch_all_initiatives, fetch_issues_for_team, get_team_by_key, fetch_issue_by_identifier, fetch_issue_history
+from src.linear_api import get_api_key, fetch_teams, fetch_all_initiatives, fetch_teams_and_initiatives, fetch_issues_for_team, get_team_by_key, fetch_issue_by_identifier, fetch_issue_history
 from src.excel_generator import create_excel, refresh_excel
-
-
-PRIORITY_LABELS = {0: "No priority", 1: "Urgent", 2: "High", 3: "Medium", 4: "Low"}
-
-
-def format_history_entry(entry: dict) -> str:
-    """Format a single history entry for display."""
-    changes = []
-
-    # Actor info
-    actor_name = "System"
-    if entry.get("actor"):
-        actor_name = entry["actor"].get("name", "Unknown")
-    elif entry.get("botActor"):
-        actor_name = f"Bot: {entry['botActor'].get('name', 'Unknown')}"
-
-    # Timestamp
-    created_at = entry.get("createdAt", "")
-    if created_at:
-        # Parse and format the timestamp
-        try:
-            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            created_at = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, AttributeError):
-            pass
-
-    # State change
-    if entry.get("fromState") or entry.get("toState"):
-        from_state = entry.get("fromState", {}).get("name", "None") if entry.get("fromState") else "None"
-        to_state = entry.get("toState", {}).get("name", "None") if entry.get("toState") else "None"
-        if from_state != to_state:
-            changes.append(f"Status: {from_state} → {to_state}")
-
-    # Assignee change
-    if entry.get("fromAssignee") or entry.get("toAssignee"):
-        from_assignee = entry.get("fromAssignee", {}).get("name", "Unassigned") if entry.get("fromAssignee") else "Unassigned"
-        to_assignee = entry.get("toAssignee", {}).get("name", "Unassigned") if entry.get("toAssignee") else "Unassigned"
-        if from_assignee != to_assignee:
-            changes.append(f"Assignee: {from_assignee} → {to_assignee}")
-
-    # Title change
-    if entry.get("fromTitle") or entry.get("toTitle"):
-        from_title = entry.get("fromTitle", "None") or "None"
-        to_title = entry.get("toTitle", "None") or "None"
-        if from_title != to_title:
-            # Truncate long titles
-            from_title = (from_title[:30] + "...") if len(from_title) > 33 else from_title
-            to_title = (to_title[:30] + "...") if len(to_title) > 33 else to_title
-            changes.append(f"Title: \"{from_title}\" → \"{to_title}\"")
-
-    # Priority change
-    if entry.get("fromPriority") is not None or entry.get("toPriority") is not None:
-        from_priority = PRIORITY_LABELS.get(entry.get("fromPriority"), "None")
-        to_priority = PRIORITY_LABELS.get(entry.get("toPriority"), "None")
-        if entry.get("fromPriority") != entry.get("toPriority"):
-            changes.append(f"Priority: {from_priority} → {to_priority}")
-
-    # Estimate change
-    if entry.get("fromEstimate") is not None or entry.get("toEstimate") is not None:
-        from_est = entry.get("fromEstimate") if entry.get("fromEstimate") is not None else "None"
-        to_est = entry.get("toEstimate") if entry.get("toEstimate") is not None else "None"
-        if from_est != to_est:
-            changes.append(f"Estimate: {from_est} → {to_est}")
-
-    # Due date change
-    if entry.get("fromDueDate") or entry.get("toDueDate"):
-        from_due = entry.get("fromDueDate", "None") or "None"
-        to_due = entry.get("toDueDate", "None") or "None"
-        if from_due != to_due:
-            changes.append(f"Due date: {from_due} → {to_due}")
-
-    # Cycle change
-    if entry.get("fromCycle") or entry.get("toCycle"):
-        from_cycle = entry.get("fromCycle", {}).get("name", "None") if entry.get("fromCycle") else "None"
-        to_cycle = entry.get("toCycle", {}).get("name", "None") if entry.get("toCycle") else "None"
-        if from_cycle != to_cycle:
-            changes.append(f"Cycle: {from_cycle} → {to_cycle}")
-
-    # Project change
-    if entry.get("fromProject") or entry.get("toProject"):
-        from_project = entry.get("fromProject", {}).get("name", "None") if entry.get("fromProject") else "None"
-        to_project = entry.get("toProject", {}).get("name", "None") if entry.get("toProject") else "None"
-        if from_project != to_project:
-            changes.append(f"Project: {from_project} → {to_project}")
-
-    # Parent change
-    if entry.get("fromParent") or entry.get("toParent"):
-        from_parent = entry.get("fromParent", {}).get("identifier", "None") if entry.get("fromParent") else "None"
-        to_parent = entry.get("toParent", {}).get("identifier", "None") if entry.get("toParent") else "None"
-        if from_parent != to_parent:
-            changes.append(f"Parent: {from_parent} → {to_parent}")
-
-    # Team change
-    if entry.get("fromTeam") or entry.get("toTeam"):
-        from_team = entry.get("fromTeam", {}).get("key", "None") if entry.get("fromTeam") else "None"
-        to_team = entry.get("toTeam", {}).get("key", "None") if entry.get("toTeam") else "None"
-        if from_team != to_team:
-            changes.append(f"Team: {from_team} → {to_team}")
-
-    # Labels added/removed
-    added_labels = entry.get("addedLabels") or []
-    removed_labels = entry.get("removedLabels") or []
-    if added_labels:
-        label_names = ", ".join(l.get("name", "?") for l in added_labels)
-        changes.append(f"Labels added: {label_names}")
-    if removed_labels:
-        label_names = ", ".join(l.get("name", "?") for l in removed_labels)
-        changes.append(f"Labels removed: {label_names}")
-
-    # Description updated
-    if entry.get("updatedDescription"):
-        changes.append("Description updated")
-
-    # Trashed
-    if entry.get("trashed") is True:
-        changes.append("Issue trashed")
-    elif entry.get("trashed") is False:
-        changes.append("Issue restored from trash")
-
-    # Auto-archived/closed
-    if entry.get("autoArchived"):
-        changes.append("Auto-archived")
-    if entry.get("autoClosed"):
-        changes.append("Auto-closed")
-
-    if not changes:
-        return ""
-
-    return f"[{created_at}] {actor_name}:\n  " + "\n  ".join(changes)
+from src.cache import set_cache_enabled
+from src.history_format import format_history_entry
 
 
 def display_issue_history(identifier: str) -> None:
@@ -161,21 +36,73 @@ def display_issue_history(identifier: str) -> None:
         click.echo("No history found for this issue.")
         return
 
-    # Sort by createdAt descending (most recent first)
-    history.sort(key=lambda x: x.get("createdAt", ""), reverse=True)
+    # Sort by createdAt descending (most recent first); the API returns entries already
+    # ordered by createdAt, so this is a near-linear pass over a presorted run
+    history.sort(key=itemgetter("createdAt"), reverse=True)
 
-    displayed_count = 0
+    # Build the whole listing first and write it in one go
+    lines = []
     for entry in history:
         formatted = format_history_entry(entry)
         if formatted:
-            click.echo(formatted)
-            click.echo("")
-            displayed_count += 1
+            lines.append(formatted)
+            lines.append("")
 
+    displayed_count = len(lines) // 2
     if displayed_count == 0:
-        click.echo("No significant changes found in history.")
+        lines.append("No significant changes found in history.")
     else:
-        click.echo(f"Total: {displayed_count} history entries")
+        lines.append(f"Total: {displayed_count} history entries")
+
+    click.echo("\n".join(lines))
+
+
+def quarter_start_monday(now: datetime) -> datetime:
+    """Return midnight on the Monday of the week containing the first day of now's quarter."""
+    first_day = date(now.year, ((now.month - 1) // 3) * 3 + 1, 1)
+    return datetime.combine(first_day - timedelta(days=first_day.weekday()), time.min)
+
+
+def parse_date_option(value: str, option_name: str) -> datetime:
+    """Parse a YYYY-MM-DD option value to midnight, exiting with an error if it is invalid."""
+    try:
+        return datetime.combine(date.fromisoformat(value), time.min)
+    except ValueError:
+        click.echo(f"Error: Invalid {option_name} format. Use YYYY-MM-DD", err=True)
+        sys.exit(1)
+
+
+def display_teams(teams: list = None) -> None:
+    """List all available teams, fetching them unless already provided."""
+    if teams is None:
+        teams = fetch_teams()
+    if not teams:
+        click.echo("No teams found.")
+        return
+    click.echo("Available teams:")
+    for t in teams:
+        click.echo(f"  {t.get('key', 'N/A'):10} - {t.get('name', 'Unknown')}")
+
+
+def display_initiatives(all_initiatives: list = None) -> None:
+    """List all available (non-archived) initiatives, fetching them unless already provided."""
+    if all_initiatives is None:
+        all_initiatives = fetch_all_initiatives()
+    if not all_initiatives:
+        click.echo("No initiatives found.")
+        return
+    click.echo("Available initiatives:")
+    for init in all_initiatives:
+        click.echo(f"  {init.get('slugId', 'N/A'):20} - {init.get('name', 'Unknown')}")
+
+
+def resolve_team(team_key: str) -> tuple:
+    """Look up a team by key and return (team_id, team_name), exiting if not found."""
+    team_data = get_team_by_key(team_key)
+    if not team_data:
+        click.echo(f"Error: Team '{team_key}' not found. Use --list-teams to see available teams.", err=True)
+        sys.exit(1)
+    return team_data["id"], team_data["name"]
 
 
 @click.command()
@@ -189,51 +116,66 @@ def display_issue_history(identifier: str) -> None:
 @click.option("--file", "-f", "existing_file", default=None, help="Existing xlsx file to refresh with latest Linear data")
 @click.option("--issue-history", "issue_id", default=None, help="Show history of a specific issue (e.g., 'APP1-123')")
 @click.option("--exclude-completed", is_flag=True, help="Exclude issues that are already completed")
-def main(team, output, start_date, end_date, initiatives, list_teams, list_initiatives, existing_file, issue_id, exclude_completed):
+@click.option("--no-cache", is_flag=True, help="Bypass the 5-minute cache of team/initiative lookups")
+def main(team, output, start_date, end_date, initiatives, list_teams, list_initiatives, existing_file, issue_id, exclude_completed, no_cache):
     """Generate a quarterly planning Excel spreadsheet from Linear."""
+    if no_cache:
+        set_cache_enabled(False)
+
     if issue_id:
         display_issue_history(issue_id)
         return
 
+    if list_teams and list_initiatives:
+        # One request for both listings
+        teams, all_initiatives = fetch_teams_and_initiatives()
+        display_teams(teams)
+        display_initiatives(all_initiatives)
+        return
+
     if list_teams:
-        teams = fetch_teams()
-        if not teams:
-            click.echo("No teams found.")
-            return
-        click.echo("Available teams:")
-        for t in teams:
-            click.echo(f"  {t.get('key', 'N/A'):10} - {t.get('name', 'Unknown')}")
+        display_teams()
         return
 
     if list_initiatives:
-        all_initiatives = fetch_all_initiatives()
-        if not all_initiatives:
-            click.echo("No initiatives found.")
-            return
-        click.echo("Available initiatives:")
-        for init in all_initiatives:
-            click.echo(f"  {init.get('slugId', 'N/A'):20} - {init.get('name', 'Unknown')}")
+        display_initiatives()
         return
 
     if not team:
         click.echo("Error: --team / -t is required.", err=True)
         sys.exit(1)
 
-    team_data = get_team_by_key(team)
-    if not team_data:
-        click.echo(f"Error: Team '{team}' not found. Use --list-teams to see available teams.", err=True)
-        sys.exit(1)
+    initiative_slugs = None
+    if initiatives is not None:
+        # Drop empty segments (e.g. trailing commas) and duplicate slugs, keeping the given order
+        initiative_slugs = tuple(dict.fromkeys(s for s in (x.strip() for x in initiatives.split(",")) if s))
+        if not initiative_slugs:
+            click.echo("Error: --initiatives / -i contains no initiative slugs.", err=True)
+            sys.exit(1)
+
+    # Validate dates before any Linear request is made
+    start = parse_date_option(start_date, "start-date") if start_date else None
+    end = parse_date_option(end_date, "end-date") if end_date else None
 
-    team_id = team_data["id"]
-    team_name = team_data["name"]
+    # Fetch initiatives (needed for -i ordering) in the background while the team lookup runs
+    initiatives_future = None
+    if initiative_slugs:
+        # Validate the API key on this thread first, so a missing key is reported once
+        # rather than by both the background fetch and the team lookup
+        get_api_key()
+        executor = ThreadPoolExecutor(max_workers=1)
+        initiatives_future = executor.submit(fetch_all_initiatives)
+        executor.shutdown(wait=False)
+
+    team_id, team_name = resolve_team(team)
     click.echo(f"Fetching data for team: {team_name} ({team})")
 
-    initiative_slugs = [s.strip() for s in initiatives.split(",")] if initiatives else None
     initiative_order = None  # Ordered list of initiative names based on -i flag order
+    all_initiatives = None
     if initiative_slugs:
-        click.echo(f"Filtering by initiatives: {initiative_slugs}")
+        click.echo(f"Filtering by initiatives: {list(initiative_slugs)}")
         # Build ordered list of initiative names from slugs
-        all_initiatives = fetch_all_initiatives()
+        all_initiatives = initiatives_future.result()
         slug_to_name = {init["slugId"]: init["name"] for init in all_initiatives if init.get("slugId")}
         initiative_order = [slug_to_name.get(slug) for slug in initiative_slugs if slug_to_name.get(slug)]
 
@@ -241,17 +183,14 @@ def main(team, output, start_date, end_date, initiatives, list_teams, list_initi
     now = datetime.now()
     quarter = f"Q{(now.month - 1) // 3 + 1} {now.year}"
 
-    if start_date:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-    else:
-        quarter_start_month = ((now.month - 1) // 3) * 3 + 1
-        start = datetime(now.year, quarter_start_month, 1)
-        start -= timedelta(days=start.weekday())  # Adjust to Monday
+    if start is None:
+        start = quarter_start_monday(now)
 
     click.echo("Fetching issues from Linear...")
     if exclude_completed:
         click.echo("Excluding completed issues...")
-    issues = fetch_issues_for_team(team_id, initiative_slugs, exclude_completed=exclude_completed)
+    # Reuse the initiatives fetched above rather than requesting them again
+    issues = fetch_issues_for_team(team_id, initiative_slugs, exclude_completed=exclude_completed, initiatives=all_initiatives)
     click.echo(f"Found {len(issues)} issues")
 
     if not issues:
@@ -259,15 +198,10 @@ def main(team, output, start_date, end_date, initiatives, list_teams, list_initi
 
     # Calculate num_weeks from end_date if provided (default: 13 weeks)
     num_weeks = 13
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-            days_diff = (end - start).days
-            num_weeks = (days_diff // 7) + 1  # +1 to include the end week
-            click.echo(f"Date range: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')} ({num_weeks} weeks)")
-        except ValueError:
-            click.echo("Error: Invalid end-date format. Use YYYY-MM-DD", err=True)
-            sys.exit(1)
+    if end is not None:
+        days_diff = (end - start).days
+        num_weeks = (days_diff // 7) + 1  # +1 to include the end week
+        click.echo(f"Date range: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')} ({num_weeks} weeks)")
 
     # Determine which mode to use
     if existing_file:
@@ -0,0 +1,61 @@
+"""Short-lived disk cache for Linear API lookups that rarely change."""
+
+import functools
+import hashlib
+import json
+import os
+import time
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "linear_to_excel")
+DEFAULT_TTL_SECONDS = 300
+
+_cache_enabled = True
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enable or disable the disk cache (disabled by the --no-cache flag)."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def _cache_path(func_name: str, args: tuple, kwargs: dict) -> str:
+    """Build the cache file path for a call, keyed by a hash of workspace (API key) and arguments."""
+    # Imported here: linear_api imports this module for the decorator
+    from src.linear_api import get_api_key
+
+    key = repr((get_api_key(), args, sorted(kwargs.items())))
+    return os.path.join(CACHE_DIR, f"{func_name}-{hashlib.sha256(key.encode()).hexdigest()[:16]}.json")
+
+
+def cached_ttl(ttl: int = DEFAULT_TTL_SECONDS):
+    """Cache a function's JSON-serializable result on disk for ttl seconds.
+
+    None results (failed or empty lookups) are not cached. Cache read/write failures are
+    ignored and fall through to the wrapped function.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _cache_enabled:
+                return func(*args, **kwargs)
+
+            path = _cache_path(func.__name__, args, kwargs)
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path) as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                pass
+
+            result = func(*args, **kwargs)
+            if result is None:
+                return result
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump(result, f)
+            except OSError:
+                pass
+            return result
+        return wrapper
+    return decorator
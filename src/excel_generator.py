@@ -1,11 +1,16 @@
 """Excel spreadsheet generation for planning documents."""
 
+import io
 import re
+import zipfile
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 
 import click
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Alignment, Font, Border, Side, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, Border, Side, PatternFill, NamedStyle
 from openpyxl.utils import get_column_letter
 
 # Colors matching the original spreadsheet
@@ -15,6 +20,20 @@ GRAY_FILL = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="sol
 RED_FILL = PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid")
 LIGHT_BLUE_FILL = PatternFill(start_color="CFE2F3", end_color="CFE2F3", fill_type="solid")
 
+# Shared styles, built once instead of per call/cell
+HEADER_FONT = Font(bold=True)
+THIN_SIDE = Side(style="thin")
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+WRAP_ALIGNMENT = Alignment(wrap_text=True)
+
+# Workbook-level settings copied from the source when a single-sheet file is refreshed
+# into a fresh write-only workbook (the full-load path keeps them as loaded)
+COPIED_WORKBOOK_SETTINGS = ("properties", "security", "calculation", "loaded_theme", "epoch", "code_name", "views")
+
+# Named styles for the week date headers (capacity header row, and bordered column header row)
+CAPACITY_WEEK_STYLE = "capacity_week"
+HEADER_WEEK_STYLE = "header_week"
+
 # Status types that should NOT show estimation points when no cycle is assigned
 INACTIVE_STATUS_TYPES = {"backlog", "triage", "canceled", "cancelled"}
 # Status types that SHOULD show estimation points when no cycle is assigned
@@ -33,6 +52,7 @@ def extract_user_story(description: str) -> str:
     "# Description", or similar patterns and extracts the content until the next section.
 
     If no such section is found, returns the first 500 characters of the description.
+    A missing (None) or empty description returns "".
     """
     if not description:
         return ""
@@ -68,10 +88,10 @@ def extract_user_story(description: str) -> str:
             content = content.strip()
 
             # Return the extracted content (limit to 500 chars)
-            return content[:500] if len(content) > 500 else content
+            return content[:500]
 
     # No User Story/Description section found, return first 500 chars
-    result = description[:500] if len(description) > 500 else description
+    result = description[:500]
     # Remove leading ">" from result as well
     result = re.sub(r'^>\s*', '', result, flags=re.MULTILINE)
     return result.strip()
@@ -102,27 +122,69 @@ def format_name(name: str, first_only: bool = True) -> str:
     return name
 
 
-def extract_unique_assignees(issues: list) -> list:
+def map_assignee_names(issues: list) -> dict:
+    """Map each raw Linear assignee name to its display name (formatted, title case).
+
+    Each distinct name is formatted once, so rows can look up their assignee
+    instead of re-running format_name per issue.
+    """
+    name_map = {}
+    for issue in issues:
+        raw_name = (issue.get("assignee") or {}).get("name")
+        if raw_name and raw_name not in name_map:
+            formatted = format_name(raw_name)
+            name_map[raw_name] = formatted.title() if formatted else ""
+    return name_map
+
+
+def extract_unique_assignees(issues: list, name_map: dict = None) -> list:
     """Extract unique assignee names from issues, formatted as proper names.
 
     Names are deduplicated case-insensitively and normalized to title case.
+    Pass name_map (from map_assignee_names) to reuse already formatted names.
     """
-    raw_names = {
-        issue["assignee"]["name"]
-        for issue in issues
-        if issue.get("assignee") and issue["assignee"].get("name")
-    }
-    # Format names and dedupe case-insensitively (use lowercase as key, title case as value)
-    seen = {}
-    for name in raw_names:
-        formatted = format_name(name)
-        if formatted:
-            # Normalize to title case and use lowercase for deduplication
-            normalized = formatted.title()
-            seen[normalized.lower()] = normalized
+    if name_map is None:
+        name_map = map_assignee_names(issues)
+    # Dedupe case-insensitively (use lowercase as key, title case as value)
+    seen = {name.lower(): name for name in name_map.values() if name}
     return sorted(seen.values())
 
 
+def issue_group_key(issue: dict) -> tuple:
+    """Return the (initiative_name, project_name) pair an issue is grouped under."""
+    project = issue.get("project")
+    if not project:
+        return "No Initiative", "No Project"
+    initiatives = project.get("initiatives")
+    nodes = initiatives.get("nodes") if initiatives else None
+    initiative_name = nodes[0].get("name") if nodes else "No Initiative"
+    return initiative_name, project.get("name", "No Project")
+
+
+def sort_issues_by_group(issues: list, initiative_order: list = None) -> list:
+    """Return (group_key, issue) pairs sorted into display order, ready for itertools.groupby.
+
+    Groups are sorted by initiative_order if provided, otherwise alphabetically;
+    initiatives not in initiative_order go at the end. The sort is stable, so issues
+    keep their original order within a group.
+    """
+    # Position of each initiative in initiative_order (first occurrence wins, like list.index)
+    initiative_rank = {}
+    for idx, name in enumerate(initiative_order or []):
+        initiative_rank.setdefault(name, idx)
+    unranked = len(initiative_order) if initiative_order else 0
+
+    def sort_key(pair):
+        initiative_name, project_name = pair[0]
+        rank = initiative_rank.get(initiative_name)
+        if rank is not None:
+            return (rank, project_name)
+        # Put non-matching initiatives at the end, sorted alphabetically
+        return (unranked, initiative_name, project_name)
+
+    return sorted(((issue_group_key(issue), issue) for issue in issues), key=sort_key)
+
+
 def get_week_index(cycle_start: str, start_date: datetime, num_weeks: int) -> int:
     """Calculate which week column index (0-based) a cycle falls into.
 
@@ -135,7 +197,12 @@ def get_week_index(cycle_start: str, start_date: datetime, num_weeks: int) -> in
     if not cycle_start:
         return -1
     try:
-        cycle_date = datetime.fromisoformat(cycle_start.replace("Z", "+00:00")).replace(tzinfo=None)
+        if len(cycle_start) >= 19 and cycle_start[10] == "T":
+            # Linear timestamps ("2025-10-06T00:00:00.000Z"): the naive wall time is the first
+            # 19 characters, so skip the offset/fraction parse and the tzinfo strip
+            cycle_date = datetime.fromisoformat(cycle_start[:19])
+        else:
+            cycle_date = datetime.fromisoformat(cycle_start.replace("Z", "+00:00")).replace(tzinfo=None)
         days_diff = (cycle_date - start_date).days
         week_index = days_diff // 7
         if days_diff < 0:
@@ -145,6 +212,66 @@ def get_week_index(cycle_start: str, start_date: datetime, num_weeks: int) -> in
         return -1
 
 
+def get_clamped_week_index(cycle_start: str, start_date: datetime, num_weeks: int) -> int:
+    """Like get_week_index, but clamped into the sheet's week range.
+
+    Invalid dates and dates before start_date map to the first week,
+    dates after the range map to the last week.
+    """
+    week_idx = get_week_index(cycle_start, start_date, num_weeks)
+    if week_idx < 0:
+        return 0
+    if week_idx >= num_weeks:
+        return num_weeks - 1
+    return week_idx
+
+
+def save_workbook(wb, path: str) -> None:
+    """Save a workbook by serializing it in memory and writing the file in one go.
+
+    Avoids the many small writes openpyxl's zip output makes, and leaves an existing
+    file untouched if serialization fails.
+    """
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    with open(path, "wb") as f:
+        f.write(buffer.getbuffer())
+
+
+def register_week_styles(wb) -> None:
+    """Add the week date header named styles to the workbook if not already present."""
+    if CAPACITY_WEEK_STYLE not in wb.named_styles:
+        wb.add_named_style(NamedStyle(
+            name=CAPACITY_WEEK_STYLE, font=HEADER_FONT, fill=YELLOW_FILL, number_format="m/d"
+        ))
+    if HEADER_WEEK_STYLE not in wb.named_styles:
+        wb.add_named_style(NamedStyle(
+            name=HEADER_WEEK_STYLE, font=HEADER_FONT, fill=YELLOW_FILL, border=THIN_BORDER, number_format="m/d"
+        ))
+
+
+def styled_cell(ws, value=None, fill=None, font=None, border=None, alignment=None, number_format=None, style=None):
+    """Create a detached cell for ws.append() with the given styles.
+
+    style names a registered named style, applied before any individual attributes.
+    Works for both regular and write-only worksheets.
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    if style is not None:
+        cell.style = style
+    if fill is not None:
+        cell.fill = fill
+    if font is not None:
+        cell.font = font
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
 def populate_sheet(
     ws,
     team_name: str,
@@ -162,149 +289,67 @@ def populate_sheet(
     All issues are still shown.
 
     If initiative_order is provided, initiatives are sorted in that order.
-    """
 
-    # Styles
-    header_font = Font(bold=True)
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
+    Rows are built in memory and appended top to bottom, so ws may be a
+    write-only worksheet.
+    """
 
     # Get unique assignees from issues
-    assignees = extract_unique_assignees(issues)
-
-    # Track which columns have Linear data vs manual estimates
-    # Key: week_idx, Value: set of sources ("Linear" or "Estimated")
-    column_sources = {i: set() for i in range(num_weeks)}
+    assignee_names = map_assignee_names(issues)
+    assignees = extract_unique_assignees(issues, assignee_names)
 
-    # Row 1: Data Source row
-    # Row 2: Capacity header and week dates
-    source_indicator_row = 1
-    capacity_header_row = 2
-    ws.cell(row=capacity_header_row, column=7, value="Assignee")
-    ws.cell(row=capacity_header_row, column=7).font = header_font
-    ws.cell(row=capacity_header_row, column=7).fill = YELLOW_FILL
+    # Last week column holding Linear (cycle) data; columns up to it form the "Linear"
+    # section of the Data Source row, the rest are "Estimation"
+    last_linear_idx = -1
 
     week_dates = generate_week_dates(start_date, num_weeks)
-    for i, date in enumerate(week_dates):
-        cell = ws.cell(row=capacity_header_row, column=8 + i, value=date)
-        cell.number_format = "m/d"
-        cell.font = header_font
-        cell.fill = YELLOW_FILL
-
-    # Add "Capacity/week" column after week dates
-    capacity_week_col = 8 + num_weeks
-    cell = ws.cell(row=capacity_header_row, column=capacity_week_col, value="Capacity/week")
-    cell.font = header_font
-    cell.fill = YELLOW_FILL
+    last_col = 7 + num_weeks  # Last column for gray fill
 
+    # Row layout:
+    # Row 1: Data Source row
+    # Row 2: Capacity header and week dates
     # Rows 3+: Engineer capacity rows (SUMIF formulas)
+    # Blank separator row
+    # Header row with column labels
+    # Data rows
     capacity_start_row = 3
-
-    # Calculate header row position (immediately after capacity section with 1 blank row)
     header_row = capacity_start_row + len(assignees) + 1
-
-    # Data rows start right after header
     data_start_row = header_row + 1
-    estimated_last_row = data_start_row + len(issues)
-
-    for idx, assignee_name in enumerate(assignees):
-        row = capacity_start_row + idx
-        ws.cell(row=row, column=7, value=assignee_name)
 
-        for i in range(num_weeks):
-            col = 8 + i
-            col_letter = get_column_letter(col)
-            formula = f'=SUMIF($G${data_start_row}:$G${estimated_last_row},$G{row},{col_letter}${data_start_row}:{col_letter}${estimated_last_row})'
-            ws.cell(row=row, column=col, value=formula)
+    # Issues in display order, paired with their (initiative, project) group key
+    keyed_issues = sort_issues_by_group(issues, initiative_order)
 
-    # Header row
-    headers = [
-        ("A", "Initiative"),
-        ("B", "Projects"),
-        ("C", "Issue"),
-        ("D", "Estimate (days)"),
-        ("E", "Description"),
-        ("F", "Linear Ticket"),
-        ("G", "Assigned to"),
-    ]
-
-    for col_letter, header_text in headers:
-        cell = ws[f"{col_letter}{header_row}"]
-        cell.value = header_text
-        cell.font = header_font
-        cell.border = thin_border
-        cell.fill = YELLOW_FILL
-
-    # Week date headers in header row (use actual dates, not formulas)
-    for i, date in enumerate(week_dates):
-        col = 8 + i
-        cell = ws.cell(row=header_row, column=col)
-        cell.value = date
-        cell.number_format = "m/d"
-        cell.font = header_font
-        cell.border = thin_border
-        cell.fill = YELLOW_FILL
-
-    # Group issues by initiative and project
-    grouped_issues = {}
-    for issue in issues:
-        project = issue.get("project") or {}
-        project_name = project.get("name", "No Project")
-        initiatives = project.get("initiatives", {}).get("nodes", [])
-        initiative_name = initiatives[0].get("name") if initiatives else "No Initiative"
-
-        key = (initiative_name, project_name)
-        grouped_issues.setdefault(key, []).append(issue)
-
-    # Write issues with gray separator rows between initiatives
-    current_row = data_start_row
+    # Build issue rows with gray separator rows between initiatives
+    data_rows = []
     last_initiative = None
-    last_col = 7 + num_weeks  # Last column for gray fill
-
-    # Sort by initiative order if provided, otherwise alphabetically
-    def sort_key(key):
-        initiative_name, project_name = key
-        if initiative_order and initiative_name in initiative_order:
-            return (initiative_order.index(initiative_name), project_name)
-        # Put non-matching initiatives at the end, sorted alphabetically
-        return (len(initiative_order) if initiative_order else 0, initiative_name, project_name)
+    cycle_week_indexes = {}  # cycle startsAt -> clamped week index; issues share a handful of cycles
 
-    for initiative_name, project_name in sorted(grouped_issues.keys(), key=sort_key):
+    for (initiative_name, project_name), group in groupby(keyed_issues, key=itemgetter(0)):
         # Add gray separator row when initiative changes (except for first)
         if last_initiative is not None and initiative_name != last_initiative:
-            for col in range(1, last_col + 1):
-                ws.cell(row=current_row, column=col).fill = GRAY_FILL
-            current_row += 1
+            data_rows.append([styled_cell(ws, fill=GRAY_FILL) for _ in range(last_col)])
 
         last_initiative = initiative_name
 
-        for issue in grouped_issues[(initiative_name, project_name)]:
-            ws.cell(row=current_row, column=1, value=initiative_name)
-            ws.cell(row=current_row, column=2, value=project_name)
-            ws.cell(row=current_row, column=3, value=issue.get("title", ""))
+        for _, issue in group:
+            row = [None] * last_col
+            row[0] = initiative_name
+            row[1] = project_name
+            row[2] = issue.get("title", "")
 
             issue_cycle = issue.get("cycle") or {}
             estimate = issue.get("estimate")
             if estimate is not None:
-                cell = ws.cell(row=current_row, column=4, value=float(estimate))
-                cell.fill = GREEN_FILL
+                estimate = float(estimate)
+                row[3] = styled_cell(ws, estimate, fill=GREEN_FILL)
 
-            description = extract_user_story(issue.get("description") or "")
-            cell = ws.cell(row=current_row, column=5, value=description)
-            cell.alignment = Alignment(wrap_text=True)
-
-            cell = ws.cell(row=current_row, column=6, value=issue.get("url", ""))
-            cell.alignment = Alignment(wrap_text=True)
+            description = extract_user_story(issue.get("description"))
+            row[4] = styled_cell(ws, description, alignment=WRAP_ALIGNMENT)
+            row[5] = styled_cell(ws, issue.get("url", ""), alignment=WRAP_ALIGNMENT)
 
+            # Formatted and title-cased (to match capacity section) once per distinct name
             assignee = issue.get("assignee") or {}
-            assignee_name = format_name(assignee.get("name", ""))
-            # Normalize to title case to match capacity section
-            if assignee_name:
-                assignee_name = assignee_name.title()
+            assignee_name = assignee_names.get(assignee.get("name"), "")
 
             # Get issue status type
             issue_state = issue.get("state") or {}
@@ -312,10 +357,9 @@ def populate_sheet(
 
             # Handle missing assignee - show "No assignee" with yellow background
             if not assignee_name:
-                ws.cell(row=current_row, column=7, value="No assignee")
-                ws.cell(row=current_row, column=7).fill = YELLOW_FILL
+                row[6] = styled_cell(ws, "No assignee", fill=YELLOW_FILL)
             else:
-                ws.cell(row=current_row, column=7, value=assignee_name)
+                row[6] = assignee_name
 
             # Fill weekly capacity based on issue's cycle
             # If cycle_id is set (by-cycles mode), only show issues up to and including this cycle
@@ -331,84 +375,94 @@ def populate_sheet(
                         should_show = issue_cycle_start <= cycle_start
 
                     if should_show:
-                        week_idx = get_week_index(issue_cycle_start, start_date, num_weeks)
-                        # Handle out-of-range: clamp to valid range
-                        if week_idx < 0:
-                            week_idx = 0
-                        elif week_idx >= num_weeks:
-                            week_idx = num_weeks - 1
-                        cell = ws.cell(row=current_row, column=8 + week_idx, value=float(estimate))
-                        cell.fill = GREEN_FILL
-                        column_sources[week_idx].add("Linear")
+                        # Out-of-range cycles are clamped to the first/last week
+                        week_idx = cycle_week_indexes.get(issue_cycle_start)
+                        if week_idx is None:
+                            week_idx = cycle_week_indexes[issue_cycle_start] = get_clamped_week_index(issue_cycle_start, start_date, num_weeks)
+                        row[7 + week_idx] = styled_cell(ws, estimate, fill=GREEN_FILL)
+                        last_linear_idx = max(last_linear_idx, week_idx)
                 elif status_type not in INACTIVE_STATUS_TYPES:
                     # Issue has no cycle but is in active status: use updatedAt date
                     # Show estimate with "(No cycle!)" suffix and yellow fill
                     updated_at = issue.get("updatedAt", "")
                     if updated_at:
-                        week_idx = get_week_index(updated_at, start_date, num_weeks)
-                        # Clamp to valid range
-                        if week_idx < 0:
-                            week_idx = 0
-                        elif week_idx >= num_weeks:
-                            week_idx = num_weeks - 1
+                        week_idx = get_clamped_week_index(updated_at, start_date, num_weeks)
                     else:
                         # Fallback to last week if no updatedAt
                         week_idx = num_weeks - 1
                     # Show estimate with "(No cycle!)" indicator
-                    cell = ws.cell(row=current_row, column=8 + week_idx, value=f"{int(estimate)} (No cycle!)")
-                    cell.fill = YELLOW_FILL
-                    column_sources[week_idx].add("Estimated")
+                    row[7 + week_idx] = styled_cell(ws, f"{int(estimate)} (No cycle!)", fill=YELLOW_FILL)
                 # else: Issue is in backlog/canceled status with no cycle - don't show estimate anywhere
 
-            current_row += 1
+            data_rows.append(row)
 
-    # Update SUMIF formulas with actual row range
-    actual_last_row = current_row - 1
-    for idx in range(len(assignees)):
-        row = capacity_start_row + idx
-        for i in range(num_weeks):
-            col = 8 + i
-            col_letter = get_column_letter(col)
-            formula = f'=SUMIF($G${data_start_row}:$G${actual_last_row},$G{row},{col_letter}${data_start_row}:{col_letter}${actual_last_row})'
-            ws.cell(row=row, column=col, value=formula)
+    # The final data range is known before any formula is written
+    actual_last_row = data_start_row + len(data_rows) - 1
 
-    # Add Data Source row (row 1)
-    # Find the last Linear column index
-    last_linear_idx = -1
-    for week_idx in range(num_weeks):
-        if "Linear" in column_sources.get(week_idx, set()):
-            last_linear_idx = week_idx
-
-    ws.cell(row=source_indicator_row, column=7, value="Data Source")
-    ws.cell(row=source_indicator_row, column=7).font = header_font
+    # Row 1: Data Source row
+    source_row = [None] * 6 + [styled_cell(ws, "Data Source", font=HEADER_FONT)]
 
     # Apply fills and labels: Linear columns get green, Estimation columns get gray
     linear_label_added = False
     estimation_label_added = False
     for week_idx in range(num_weeks):
-        cell = ws.cell(row=source_indicator_row, column=8 + week_idx)
         if week_idx <= last_linear_idx and last_linear_idx >= 0:
             # Linear section: green background, label only on first column
-            cell.fill = GREEN_FILL
             if not linear_label_added:
-                cell.value = "Linear"
-                cell.font = header_font
+                cell = styled_cell(ws, "Linear", fill=GREEN_FILL, font=HEADER_FONT)
                 linear_label_added = True
+            else:
+                cell = styled_cell(ws, fill=GREEN_FILL)
         else:
             # Estimation section: gray background for all remaining columns, label only on first
-            cell.fill = GRAY_FILL
             if not estimation_label_added:
-                cell.value = "Estimation"
-                cell.font = header_font
+                cell = styled_cell(ws, "Estimation", fill=GRAY_FILL, font=HEADER_FONT)
                 estimation_label_added = True
+            else:
+                cell = styled_cell(ws, fill=GRAY_FILL)
+        source_row.append(cell)
+
+    # Row 2: Capacity header and week dates, plus "Capacity/week" column after week dates
+    capacity_header = [None] * 6 + [styled_cell(ws, "Assignee", font=HEADER_FONT, fill=YELLOW_FILL)]
+    register_week_styles(ws.parent)
+    for date in week_dates:
+        capacity_header.append(styled_cell(ws, date, style=CAPACITY_WEEK_STYLE))
+    capacity_header.append(styled_cell(ws, "Capacity/week", font=HEADER_FONT, fill=YELLOW_FILL))
+
+    # Rows 3+: Engineer capacity rows (SUMIF formulas)
+    week_col_letters = [get_column_letter(8 + i) for i in range(num_weeks)]
+    sum_ranges = [f"{col_letter}${data_start_row}:{col_letter}${actual_last_row})" for col_letter in week_col_letters]
+    capacity_rows = []
+    for idx, assignee_name in enumerate(assignees):
+        formula_prefix = f"=SUMIF($G${data_start_row}:$G${actual_last_row},$G{capacity_start_row + idx},"
+        capacity_rows.append([None] * 6 + [assignee_name] + [formula_prefix + sum_range for sum_range in sum_ranges])
+
+    # Header row
+    headers = ["Initiative", "Projects", "Issue", "Estimate (days)", "Description", "Linear Ticket", "Assigned to"]
+    header_cells = [styled_cell(ws, text, font=HEADER_FONT, border=THIN_BORDER, fill=YELLOW_FILL) for text in headers]
+    # Week date headers in header row (use actual dates, not formulas)
+    for date in week_dates:
+        header_cells.append(styled_cell(ws, date, style=HEADER_WEEK_STYLE))
 
     # Column widths (A=Initiative, B=Projects, C=Issue, D=Estimate, E=Description, F=Linear Ticket, G=Assigned to)
+    # Set before appending rows, as write-only sheets emit column info with the first row
     widths = {"A": 30, "B": 35, "C": 50, "D": 15, "E": 50, "F": 40, "G": 15}
     for col_letter, width in widths.items():
         ws.column_dimensions[col_letter].width = width
 
-    for i in range(num_weeks + 1):
-        ws.column_dimensions[get_column_letter(8 + i)].width = 8
+    # One column definition spanning the week columns plus "Capacity/week"
+    week_dimension = ws.column_dimensions[get_column_letter(8)]
+    week_dimension.width = 8
+    week_dimension.min, week_dimension.max = 8, 8 + num_weeks
+
+    ws.append(source_row)
+    ws.append(capacity_header)
+    for row in capacity_rows:
+        ws.append(row)
+    ws.append([])  # Blank separator row
+    ws.append(header_cells)
+    for row in data_rows:
+        ws.append(row)
 
 
 def create_excel(
@@ -420,14 +474,16 @@ def create_excel(
     num_weeks: int = 13,
     initiative_order: list = None,
 ):
-    """Create a new Excel planning spreadsheet."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = start_date.strftime("%m-%d")
+    """Create a new Excel planning spreadsheet.
+
+    Uses a write-only workbook so rows stream to disk instead of being held as cell objects.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=start_date.strftime("%m-%d"))
 
     populate_sheet(ws, team_name, quarter, issues, start_date, num_weeks, initiative_order=initiative_order)
 
-    wb.save(output_file)
+    save_workbook(wb, output_file)
     click.echo(f"Excel file saved to: {output_file}")
 
 
@@ -445,22 +501,41 @@ def refresh_excel(
     For issues WITH assignee in Linear: refresh all data including estimate placement
     For issues WITHOUT assignee in Linear: preserve existing assignee and estimate placement
     """
-    wb = load_workbook(input_file)
-
-    # Read existing data from the file
-    existing_capacity, existing_assignees, existing_num_weeks = read_existing_capacity_data(wb, start_date)
+    # Read existing data from the file with a streaming read-only pass
+    source = load_workbook(input_file, read_only=True)
+    try:
+        existing_capacity, existing_assignees, existing_num_weeks = read_existing_capacity_data(source, start_date)
+        sheet_count = len(source.sheetnames)
+        old_title = source.active.title
+        workbook_settings = {name: getattr(source, name) for name in COPIED_WORKBOOK_SETTINGS}
+        # Workbook-level content a fresh workbook could not carry over
+        has_workbook_content = bool(source.defined_names or source.custom_doc_props)
+    finally:
+        source.close()
+    if not has_workbook_content:
+        # External links have no public accessor; look for their parts in the package
+        with zipfile.ZipFile(input_file) as package:
+            has_workbook_content = any(name.startswith("xl/externalLinks/") for name in package.namelist())
 
     # Extend num_weeks to match existing file if it has more columns
     if existing_num_weeks > num_weeks:
         click.echo(f"Extending weeks from {num_weeks} to {existing_num_weeks} to match existing file")
         num_weeks = existing_num_weeks
 
-    old_sheet = wb.active
-    old_title = old_sheet.title
-
-    # Remove old sheet and create fresh one
-    wb.remove(old_sheet)
-    ws = wb.create_sheet(title=old_title, index=0)
+    if sheet_count == 1 and not has_workbook_content:
+        # The planning sheet is the only sheet: write a fresh write-only workbook
+        # rather than fully loading the file just to replace that sheet,
+        # carrying over the workbook-level settings
+        wb = Workbook(write_only=True)
+        for name, value in workbook_settings.items():
+            setattr(wb, name, value)
+        ws = wb.create_sheet(title=old_title)
+    else:
+        # Keep the other sheets and workbook-level content (defined names, custom
+        # properties, links): load the full workbook, remove old sheet and create fresh one
+        wb = load_workbook(input_file)
+        wb.remove(wb.active)
+        ws = wb.create_sheet(title=old_title, index=0)
 
     populate_sheet_refresh(
         ws, team_name, quarter, issues, start_date, num_weeks,
@@ -468,7 +543,7 @@ def refresh_excel(
         initiative_order=initiative_order
     )
 
-    wb.save(input_file)
+    save_workbook(wb, input_file)
     click.echo(f"Excel file refreshed: {input_file}")
 
 
@@ -489,23 +564,17 @@ def populate_sheet_refresh(
     For issues WITHOUT assignee in Linear: preserve existing assignee and estimate placement from Excel
 
     If initiative_order is provided, initiatives are sorted in that order.
+
+    Rows are built in memory and appended top to bottom to the (empty) worksheet.
     """
     if existing_capacity is None:
         existing_capacity = {}
     if existing_assignees is None:
         existing_assignees = {}
 
-    # Styles
-    header_font = Font(bold=True)
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-
     # Get unique assignees from issues and existing Excel data
-    assignees = extract_unique_assignees(issues)
+    assignee_names = map_assignee_names(issues)
+    assignees = extract_unique_assignees(issues, assignee_names)
 
     # Add existing assignees from Excel that aren't already in the list (case-insensitive)
     existing_lower = {a.lower() for a in assignees}
@@ -520,9 +589,9 @@ def populate_sheet_refresh(
 
     week_dates = generate_week_dates(start_date, num_weeks)
 
-    # Track which columns have Linear data vs manual estimates (will be filled during data processing)
-    # Key: week_idx, Value: set of sources ("Linear" or "Estimated")
-    column_sources = {i: set() for i in range(num_weeks)}
+    # Last week column holding Linear (cycle) data (will be filled during data processing);
+    # columns up to it form the "Linear" section of the Data Source row, the rest are "Estimation"
+    last_linear_idx = -1
 
     # Row layout:
     # Row 1: Data Source row (Linear/Estimation per column)
@@ -531,28 +600,8 @@ def populate_sheet_refresh(
     # Blank separator row
     # Header row with column labels
     # Data rows
-
-    source_indicator_row = 1
-    capacity_header_row = 2
     capacity_start_row = 3
 
-    # Write Capacity header row
-    ws.cell(row=capacity_header_row, column=8, value="Assignee")
-    ws.cell(row=capacity_header_row, column=8).font = header_font
-    ws.cell(row=capacity_header_row, column=8).fill = YELLOW_FILL
-
-    for i, date in enumerate(week_dates):
-        cell = ws.cell(row=capacity_header_row, column=9 + i, value=date)
-        cell.number_format = "m/d"
-        cell.font = header_font
-        cell.fill = YELLOW_FILL
-
-    # Add "Capacity/week" column after week dates
-    capacity_week_col = 9 + num_weeks
-    cell = ws.cell(row=capacity_header_row, column=capacity_week_col, value="Capacity/week")
-    cell.font = header_font
-    cell.fill = YELLOW_FILL
-
     # Calculate remaining row positions
     # - capacity_start_row + len(assignees) - 1: last capacity row
     # - +1: blank separator row
@@ -561,108 +610,50 @@ def populate_sheet_refresh(
 
     # Data rows start right after header
     data_start_row = header_row + 1
-    estimated_last_row = data_start_row + len(issues)
-
-    for idx, assignee_name in enumerate(assignees):
-        row = capacity_start_row + idx
-        ws.cell(row=row, column=8, value=assignee_name)
-
-        for i in range(num_weeks):
-            col = 9 + i
-            col_letter = get_column_letter(col)
-            formula = f'=SUMIF($H${data_start_row}:$H${estimated_last_row},$H{row},{col_letter}${data_start_row}:{col_letter}${estimated_last_row})'
-            ws.cell(row=row, column=col, value=formula)
-
-    # Header row - Column A shows data source (Linear vs Estimated)
-    headers = [
-        ("A", "Linear vs Estimated"),
-        ("B", "Initiative"),
-        ("C", "Projects"),
-        ("D", "Issue"),
-        ("E", "Estimate (days)"),
-        ("F", "Description"),
-        ("G", "Linear Ticket"),
-        ("H", "Assigned to"),
-    ]
-
-    for col_letter, header_text in headers:
-        cell = ws[f"{col_letter}{header_row}"]
-        cell.value = header_text
-        cell.font = header_font
-        cell.border = thin_border
-        cell.fill = YELLOW_FILL
-
-    # Week date headers in header row (use actual dates)
-    for i, date in enumerate(week_dates):
-        col = 9 + i
-        cell = ws.cell(row=header_row, column=col)
-        cell.value = date
-        cell.number_format = "m/d"
-        cell.font = header_font
-        cell.border = thin_border
-        cell.fill = YELLOW_FILL
-
-    # Group issues by initiative and project
-    grouped_issues = {}
-    for issue in issues:
-        project = issue.get("project") or {}
-        project_name = project.get("name", "No Project")
-        initiatives = project.get("initiatives", {}).get("nodes", [])
-        initiative_name = initiatives[0].get("name") if initiatives else "No Initiative"
 
-        key = (initiative_name, project_name)
-        grouped_issues.setdefault(key, []).append(issue)
+    # Issues in display order, paired with their (initiative, project) group key
+    keyed_issues = sort_issues_by_group(issues, initiative_order)
 
-    # Write issues with gray separator rows between initiatives
-    current_row = data_start_row
+    # Build issue rows with gray separator rows between initiatives
+    data_rows = []
     last_initiative = None
     last_col = 8 + num_weeks  # Last column for gray fill
+    cycle_week_indexes = {}  # cycle startsAt -> clamped week index; issues share a handful of cycles
 
-    # Sort by initiative order if provided, otherwise alphabetically
-    def sort_key(key):
-        initiative_name, project_name = key
-        if initiative_order and initiative_name in initiative_order:
-            return (initiative_order.index(initiative_name), project_name)
-        # Put non-matching initiatives at the end, sorted alphabetically
-        return (len(initiative_order) if initiative_order else 0, initiative_name, project_name)
-
-    for initiative_name, project_name in sorted(grouped_issues.keys(), key=sort_key):
+    for (initiative_name, project_name), group in groupby(keyed_issues, key=itemgetter(0)):
         # Add gray separator row when initiative changes (except for first)
         if last_initiative is not None and initiative_name != last_initiative:
-            for col in range(1, last_col + 1):  # Start from column A
-                ws.cell(row=current_row, column=col).fill = GRAY_FILL
-            current_row += 1
+            data_rows.append([styled_cell(ws, fill=GRAY_FILL) for _ in range(last_col)])  # Start from column A
 
         last_initiative = initiative_name
 
-        for issue in grouped_issues[(initiative_name, project_name)]:
+        for _, issue in group:
             # Determine data source: "Linear" if Linear has both estimate and assignee, "Estimated" otherwise
+            # Read each issue field once
             linear_assignee = issue.get("assignee") or {}
             linear_has_assignee = bool(linear_assignee.get("name"))
-            linear_has_estimate = issue.get("estimate") is not None
-            issue_cycle = issue.get("cycle") or {}
-            linear_has_cycle = bool(issue_cycle.get("startsAt", ""))
+            estimate = issue.get("estimate")
+            linear_has_estimate = estimate is not None
+            if linear_has_estimate:
+                estimate = float(estimate)
+            issue_cycle_start = (issue.get("cycle") or {}).get("startsAt", "")
+            linear_has_cycle = bool(issue_cycle_start)
 
+            row = [None] * last_col
             # "Linear" if assignee and estimate exist in Linear, otherwise "Estimated"
-            data_source = "Linear" if (linear_has_assignee and linear_has_estimate) else "Estimated"
-            ws.cell(row=current_row, column=1, value=data_source)
+            row[0] = "Linear" if (linear_has_assignee and linear_has_estimate) else "Estimated"
+            row[1] = initiative_name
+            row[2] = project_name
+            row[3] = issue.get("title", "")
 
-            ws.cell(row=current_row, column=2, value=initiative_name)
-            ws.cell(row=current_row, column=3, value=project_name)
-            ws.cell(row=current_row, column=4, value=issue.get("title", ""))
+            if linear_has_estimate:
+                row[4] = styled_cell(ws, estimate, fill=GREEN_FILL)
 
-            estimate = issue.get("estimate")
-            if estimate is not None:
-                cell = ws.cell(row=current_row, column=5, value=float(estimate))
-                cell.fill = GREEN_FILL
-
-            description = extract_user_story(issue.get("description") or "")
-            cell = ws.cell(row=current_row, column=6, value=description)
-            cell.alignment = Alignment(wrap_text=True)
+            description = extract_user_story(issue.get("description"))
+            row[5] = styled_cell(ws, description, alignment=WRAP_ALIGNMENT)
 
             issue_url = issue.get("url", "")
-            cell = ws.cell(row=current_row, column=7, value=issue_url)
-            cell.alignment = Alignment(wrap_text=True)
+            row[6] = styled_cell(ws, issue_url, alignment=WRAP_ALIGNMENT)
 
             # Get issue status type
             issue_state = issue.get("state") or {}
@@ -670,7 +661,7 @@ def populate_sheet_refresh(
 
             if linear_has_assignee:
                 # Linear has assignee: use Linear data
-                assignee_name = format_name(linear_assignee.get("name", ""))
+                assignee_name = assignee_names[linear_assignee["name"]]
             else:
                 # No assignee in Linear: preserve existing Excel assignee
                 assignee_name = existing_assignees.get(issue_url, "")
@@ -681,115 +672,129 @@ def populate_sheet_refresh(
 
             # Handle missing assignee - show "No assignee" with yellow background
             if not assignee_name:
-                ws.cell(row=current_row, column=8, value="No assignee")
-                ws.cell(row=current_row, column=8).fill = YELLOW_FILL
+                row[7] = styled_cell(ws, "No assignee", fill=YELLOW_FILL)
             else:
-                ws.cell(row=current_row, column=8, value=assignee_name)
+                row[7] = assignee_name
 
             # Fill weekly capacity
-            issue_cycle_start = issue_cycle.get("startsAt", "")
-
             # Track which week index came from Linear (if any)
             linear_week_idx = None
             has_linear_placement = False
 
-            if linear_has_cycle and estimate is not None:
+            if linear_has_cycle and linear_has_estimate:
                 # Linear has cycle: calculate the week position
-                linear_week_idx = get_week_index(issue_cycle_start, start_date, num_weeks)
-                if linear_week_idx < 0:
-                    linear_week_idx = 0
-                elif linear_week_idx >= num_weeks:
-                    linear_week_idx = num_weeks - 1
+                linear_week_idx = cycle_week_indexes.get(issue_cycle_start)
+                if linear_week_idx is None:
+                    linear_week_idx = cycle_week_indexes[issue_cycle_start] = get_clamped_week_index(issue_cycle_start, start_date, num_weeks)
 
                 # Linear data gets green fill
-                cell = ws.cell(row=current_row, column=9 + linear_week_idx, value=float(estimate))
-                cell.fill = GREEN_FILL
-                column_sources[linear_week_idx].add("Linear")
+                row[8 + linear_week_idx] = styled_cell(ws, estimate, fill=GREEN_FILL)
+                last_linear_idx = max(last_linear_idx, linear_week_idx)
                 has_linear_placement = True
-            elif estimate is not None and status_type not in INACTIVE_STATUS_TYPES:
+            elif linear_has_estimate and status_type not in INACTIVE_STATUS_TYPES:
                 # No cycle but active status: use updatedAt date with "(No cycle!)" indicator
                 updated_at = issue.get("updatedAt", "")
                 if updated_at:
-                    week_idx = get_week_index(updated_at, start_date, num_weeks)
-                    if week_idx < 0:
-                        week_idx = 0
-                    elif week_idx >= num_weeks:
-                        week_idx = num_weeks - 1
+                    week_idx = get_clamped_week_index(updated_at, start_date, num_weeks)
                 else:
                     week_idx = num_weeks - 1
-                cell = ws.cell(row=current_row, column=9 + week_idx, value=f"{int(estimate)} (No cycle!)")
-                cell.fill = YELLOW_FILL
-                column_sources[week_idx].add("Estimated")
+                row[8 + week_idx] = styled_cell(ws, f"{int(estimate)} (No cycle!)", fill=YELLOW_FILL)
                 has_linear_placement = True  # Don't try to restore from existing file
 
             # Only preserve existing Excel estimate placements if Linear did NOT place an estimate
-            # (i.e., Linear doesn't have cycle info for this issue)
+            # (i.e., Linear doesn't have cycle info for this issue); only the weeks the existing
+            # file filled in for this URL are visited
             if not has_linear_placement:
-                for week_idx in range(num_weeks):
-                    existing_val = existing_capacity.get((issue_url, week_idx))
-                    # Only preserve non-zero values (skip 0 or near-zero values)
-                    if existing_val is not None and existing_val > 0:
+                for week_idx, existing_val in existing_capacity.get(issue_url, {}).items():
+                    # Only preserve non-zero values (skip 0 or near-zero values) within the week range
+                    if week_idx < num_weeks and existing_val > 0:
                         # Manual/estimated data gets yellow fill
-                        cell = ws.cell(row=current_row, column=9 + week_idx, value=existing_val)
-                        cell.fill = YELLOW_FILL
-                        column_sources[week_idx].add("Estimated")
-
-            current_row += 1
-
-    # Update SUMIF formulas with actual row range
-    actual_last_row = current_row - 1
-    for idx in range(len(assignees)):
-        row = capacity_start_row + idx
-        for i in range(num_weeks):
-            col = 9 + i
-            col_letter = get_column_letter(col)
-            formula = f'=SUMIF($H${data_start_row}:$H${actual_last_row},$H{row},{col_letter}${data_start_row}:{col_letter}${actual_last_row})'
-            ws.cell(row=row, column=col, value=formula)
-
-    # Add Data Source row (row 1)
-    # Find the last Linear column index
-    last_linear_idx = -1
-    for week_idx in range(num_weeks):
-        if "Linear" in column_sources.get(week_idx, set()):
-            last_linear_idx = week_idx
+                        row[8 + week_idx] = styled_cell(ws, existing_val, fill=YELLOW_FILL)
 
-    ws.cell(row=source_indicator_row, column=8, value="Data Source")
-    ws.cell(row=source_indicator_row, column=8).font = header_font
+            data_rows.append(row)
+
+    # The final data range is known before any formula is written
+    actual_last_row = data_start_row + len(data_rows) - 1
+
+    # Row 1: Data Source row
+    source_row = [None] * 7 + [styled_cell(ws, "Data Source", font=HEADER_FONT)]
 
     # Apply fills and labels: Linear columns get green, Estimation columns get gray
     linear_label_added = False
     estimation_label_added = False
     for week_idx in range(num_weeks):
-        cell = ws.cell(row=source_indicator_row, column=9 + week_idx)
         if week_idx <= last_linear_idx and last_linear_idx >= 0:
             # Linear section: green background, label only on first column
-            cell.fill = GREEN_FILL
             if not linear_label_added:
-                cell.value = "Linear"
-                cell.font = header_font
+                cell = styled_cell(ws, "Linear", fill=GREEN_FILL, font=HEADER_FONT)
                 linear_label_added = True
+            else:
+                cell = styled_cell(ws, fill=GREEN_FILL)
         else:
             # Estimation section: gray background for all remaining columns, label only on first
-            cell.fill = GRAY_FILL
             if not estimation_label_added:
-                cell.value = "Estimation"
-                cell.font = header_font
+                cell = styled_cell(ws, "Estimation", fill=GRAY_FILL, font=HEADER_FONT)
                 estimation_label_added = True
+            else:
+                cell = styled_cell(ws, fill=GRAY_FILL)
+        source_row.append(cell)
+
+    # Row 2: Capacity header and week dates, plus "Capacity/week" column after week dates
+    capacity_header = [None] * 7 + [styled_cell(ws, "Assignee", font=HEADER_FONT, fill=YELLOW_FILL)]
+    register_week_styles(ws.parent)
+    for date in week_dates:
+        capacity_header.append(styled_cell(ws, date, style=CAPACITY_WEEK_STYLE))
+    capacity_header.append(styled_cell(ws, "Capacity/week", font=HEADER_FONT, fill=YELLOW_FILL))
+
+    # Rows 3+: Engineer capacity rows (SUMIF formulas)
+    week_col_letters = [get_column_letter(9 + i) for i in range(num_weeks)]
+    sum_ranges = [f"{col_letter}${data_start_row}:{col_letter}${actual_last_row})" for col_letter in week_col_letters]
+    capacity_rows = []
+    for idx, assignee_name in enumerate(assignees):
+        formula_prefix = f"=SUMIF($H${data_start_row}:$H${actual_last_row},$H{capacity_start_row + idx},"
+        capacity_rows.append([None] * 7 + [assignee_name] + [formula_prefix + sum_range for sum_range in sum_ranges])
+
+    # Header row - Column A shows data source (Linear vs Estimated)
+    headers = [
+        "Linear vs Estimated",  # A
+        "Initiative",  # B
+        "Projects",  # C
+        "Issue",  # D
+        "Estimate (days)",  # E
+        "Description",  # F
+        "Linear Ticket",  # G
+        "Assigned to",  # H
+    ]
+    header_cells = [styled_cell(ws, text, font=HEADER_FONT, border=THIN_BORDER, fill=YELLOW_FILL) for text in headers]
+    # Week date headers in header row (use actual dates)
+    for date in week_dates:
+        header_cells.append(styled_cell(ws, date, style=HEADER_WEEK_STYLE))
 
     # Column widths (A=Linear vs Estimated, G=Linear Ticket fixed width, H=Assigned to)
     widths = {"A": 18, "B": 30, "C": 35, "D": 50, "E": 15, "F": 50, "G": 40, "H": 15}
     for col_letter, width in widths.items():
         ws.column_dimensions[col_letter].width = width
 
-    for i in range(num_weeks + 1):
-        ws.column_dimensions[get_column_letter(9 + i)].width = 8
+    # One column definition spanning the week columns plus "Capacity/week"
+    week_dimension = ws.column_dimensions[get_column_letter(9)]
+    week_dimension.width = 8
+    week_dimension.min, week_dimension.max = 9, 9 + num_weeks
+
+    ws.append(source_row)
+    ws.append(capacity_header)
+    for row in capacity_rows:
+        ws.append(row)
+    ws.append([])  # Blank separator row
+    ws.append(header_cells)
+    for row in data_rows:
+        ws.append(row)
 
 
 def read_existing_capacity_data(wb, start_date: datetime) -> tuple:
     """Read existing capacity data and assignees from the first sheet of the workbook.
 
     Returns a tuple of:
-    - capacity_data: dict mapping (issue_url, week_index) -> estimate value
+    - capacity_data: dict mapping issue_url -> {week_index: estimate value}
     - assignee_data: dict mapping issue_url -> assignee name
     - max_week_idx: the maximum week index found in the existing file (for extending num_weeks)
     """
@@ -801,19 +806,28 @@ def read_existing_capacity_data(wb, start_date: datetime) -> tuple:
     assignee_data = {}
     max_week_idx = 0
 
+    # Read all cell values once as plain tuples (no Cell objects per lookup)
+    # Pad rows with None to a common width, at least column I (the furthest column checked below);
+    # read-only sheets yield ragged rows when the file has no stored dimensions
+    if wb.read_only:
+        ws.reset_dimensions()  # Stored dimensions may be stale; read every row
+    rows = list(ws.iter_rows(values_only=True))
+    width = max([9, *(len(values) for values in rows)])
+    rows = [tuple(values) + (None,) * (width - len(values)) for values in rows]
+
     # Find header row by looking for "Linear Ticket" in column G
     # Also check column F for older file formats without "Linear vs Estimated" column
     header_row = None
     linear_ticket_col = None
-    for row in range(1, min(50, ws.max_row + 1)):
+    for row, values in enumerate(rows[:49], start=1):
         # Check column G first (new format with "Linear vs Estimated" in column A)
-        cell_val_g = ws.cell(row=row, column=7).value
+        cell_val_g = values[6]
         if cell_val_g and "Linear Ticket" in str(cell_val_g):
             header_row = row
             linear_ticket_col = 7
             break
         # Check column F (old format without "Linear vs Estimated" column)
-        cell_val_f = ws.cell(row=row, column=6).value
+        cell_val_f = values[5]
         if cell_val_f and "Linear Ticket" in str(cell_val_f):
             header_row = row
             linear_ticket_col = 6
@@ -831,14 +845,10 @@ def read_existing_capacity_data(wb, start_date: datetime) -> tuple:
     # Find the capacity header row by looking for "Capacity" label
     # This row has all the week dates and is more reliable for parsing
     capacity_header_row = None
-    for row in range(1, header_row):
+    for row, values in enumerate(rows[:header_row - 1], start=1):
         # Check for "Capacity" in column H (8) or nearby columns
-        for check_col in range(6, 10):
-            cell_val = ws.cell(row=row, column=check_col).value
-            if cell_val and str(cell_val).strip() == "Capacity":
-                capacity_header_row = row
-                break
-        if capacity_header_row:
+        if any(cell_val and str(cell_val).strip() == "Capacity" for cell_val in values[5:9]):
+            capacity_header_row = row
             break
 
     # Use capacity header row for date parsing if found, otherwise use data header row
@@ -846,8 +856,7 @@ def read_existing_capacity_data(wb, start_date: datetime) -> tuple:
 
     # Find week columns by parsing dates in the header row
     week_col_map = {}  # week_index -> column
-    for col in range(week_start_col, ws.max_column + 1):
-        cell_val = ws.cell(row=date_header_row, column=col).value
+    for col, cell_val in enumerate(rows[date_header_row - 1][week_start_col - 1:], start=week_start_col):
         if cell_val:
             if isinstance(cell_val, datetime):
                 week_date = cell_val
@@ -872,26 +881,29 @@ def read_existing_capacity_data(wb, start_date: datetime) -> tuple:
                 if week_idx > max_week_idx:
                     max_week_idx = week_idx
 
-    # Read data rows (start after header row)
-    for row in range(header_row + 1, ws.max_row + 1):
-        url = ws.cell(row=row, column=linear_ticket_col).value  # Linear Ticket URL
+    # Read data rows (start after header row), indexing the value tuples (0-based)
+    url_idx = linear_ticket_col - 1
+    assignee_idx = assignee_col - 1
+    week_value_idx = [(week_idx, col - 1) for week_idx, col in week_col_map.items()]
+    for values in rows[header_row:]:
+        url = values[url_idx]  # Linear Ticket URL
         if not url:
             continue
 
         # Read assignee (normalize to title case)
-        assignee_val = ws.cell(row=row, column=assignee_col).value
+        assignee_val = values[assignee_idx]
         if assignee_val:
             assignee_data[url] = str(assignee_val).title()
 
         # Read capacity values for each week
-        for week_idx, col in week_col_map.items():
-            cell_val = ws.cell(row=row, column=col).value
+        for week_idx, value_idx in week_value_idx:
+            cell_val = values[value_idx]
             if cell_val is not None and cell_val != "":
                 try:
                     val = float(cell_val)
                     # Only store non-zero values
                     if val > 0:
-                        capacity_data[(url, week_idx)] = val
+                        capacity_data.setdefault(url, {})[week_idx] = val
                 except (ValueError, TypeError):
                     pass
 
@@ -0,0 +1,134 @@
+"""Formatting of Linear issue history entries for display."""
+
+from datetime import datetime
+
+PRIORITY_LABELS = {0: "No priority", 1: "Urgent", 2: "High", 3: "Medium", 4: "Low"}
+
+# Kinds of tracked history field, deciding how from/to values are compared and displayed
+OBJECT_FIELD = "object"  # Nested object (state, assignee, ...): compare one attribute
+NUMBER_FIELD = "number"  # Numeric value: 0 is a real value
+PRIORITY_FIELD = "priority"  # Numeric priority level: compared raw, displayed via PRIORITY_LABELS
+TEXT_FIELD = "text"  # Plain string value
+TITLE_FIELD = "title"  # String compared in full, displayed quoted and truncated
+
+# Tracked from/to history fields in display order: (label, kind, from key, to key, nested attribute, default).
+# The nested attribute is only used by OBJECT_FIELD fields.
+HISTORY_FIELDS = (
+    ("Status", OBJECT_FIELD, "fromState", "toState", "name", "None"),
+    ("Assignee", OBJECT_FIELD, "fromAssignee", "toAssignee", "name", "Unassigned"),
+    ("Title", TITLE_FIELD, "fromTitle", "toTitle", None, "None"),
+    ("Priority", PRIORITY_FIELD, "fromPriority", "toPriority", None, "None"),
+    ("Estimate", NUMBER_FIELD, "fromEstimate", "toEstimate", None, "None"),
+    ("Due date", TEXT_FIELD, "fromDueDate", "toDueDate", None, "None"),
+    ("Cycle", OBJECT_FIELD, "fromCycle", "toCycle", "name", "None"),
+    ("Project", OBJECT_FIELD, "fromProject", "toProject", "name", "None"),
+    ("Parent", OBJECT_FIELD, "fromParent", "toParent", "identifier", "None"),
+    ("Team", OBJECT_FIELD, "fromTeam", "toTeam", "key", "None"),
+)
+# Layout of one formatted history entry: header line, then one indented line per change
+HISTORY_ENTRY_TEMPLATE = "[{timestamp}] {actor}:\n  {changes}"
+# Every key that can produce a change line; entries with none of them set (comments etc.) are skipped
+TRACKED_HISTORY_KEYS = tuple(key for field in HISTORY_FIELDS for key in field[2:4]) + (
+    "addedLabels", "removedLabels", "updatedDescription", "trashed", "autoArchived", "autoClosed",
+)
+
+
+def format_history_entry(entry: dict) -> str:
+    """Format a single history entry for display."""
+    changes = []
+    get = entry.get
+    priority_label = PRIORITY_LABELS.get
+
+    # The query selects every field, so check values rather than key presence
+    if all(get(key) is None for key in TRACKED_HISTORY_KEYS):
+        return ""
+
+    # Actor info
+    actor = get("actor")
+    bot_actor = get("botActor")
+    actor_name = "System"
+    if actor:
+        actor_name = actor.get("name", "Unknown")
+    elif bot_actor:
+        actor_name = f"Bot: {bot_actor.get('name', 'Unknown')}"
+
+    # Timestamp
+    created_at = get("createdAt", "")
+    if created_at and len(created_at) >= 19 and created_at[10] == "T":
+        # Linear returns ISO-8601 ("2025-01-15T14:22:33.123Z"), slice out date and time
+        created_at = created_at[:10] + " " + created_at[11:19]
+    elif created_at:
+        # Parse and format the timestamp
+        try:
+            dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+            created_at = dt.strftime("%Y-%m-%d %H:%M:%S")
+        except (ValueError, AttributeError):
+            pass
+
+    for label, kind, from_key, to_key, attr, default in HISTORY_FIELDS:
+        from_val, to_val = get(from_key), get(to_key)
+        if kind == OBJECT_FIELD:
+            # Object field (state, assignee, cycle, ...): compare the nested attribute
+            if not (from_val or to_val):
+                continue
+            from_val = (from_val or {}).get(attr, default)
+            to_val = (to_val or {}).get(attr, default)
+        elif kind in (NUMBER_FIELD, PRIORITY_FIELD):
+            # Numeric field: 0 is a real value, so only skip when both sides are missing
+            if from_val is None and to_val is None:
+                continue
+            if kind == PRIORITY_FIELD:
+                # Compare raw levels; labels are only for display
+                if from_val != to_val:
+                    changes.append(f"{label}: {priority_label(from_val, default)} → {priority_label(to_val, default)}")
+                continue
+            from_val = from_val if from_val is not None else default
+            to_val = to_val if to_val is not None else default
+        else:
+            # Plain string field (title, due date)
+            if not (from_val or to_val):
+                continue
+            from_val = from_val or default
+            to_val = to_val or default
+            if kind == TITLE_FIELD:
+                # Compare full titles; display them quoted and truncated
+                if from_val != to_val:
+                    from_val = (from_val[:30] + "...") if len(from_val) > 33 else from_val
+                    to_val = (to_val[:30] + "...") if len(to_val) > 33 else to_val
+                    changes.append(f"{label}: \"{from_val}\" → \"{to_val}\"")
+                continue
+
+        if from_val != to_val:
+            changes.append(f"{label}: {from_val} → {to_val}")
+
+    # Labels added/removed
+    added_labels = get("addedLabels") or []
+    removed_labels = get("removedLabels") or []
+    if added_labels:
+        label_names = ", ".join(l.get("name", "?") for l in added_labels)
+        changes.append(f"Labels added: {label_names}")
+    if removed_labels:
+        label_names = ", ".join(l.get("name", "?") for l in removed_labels)
+        changes.append(f"Labels removed: {label_names}")
+
+    # Description updated
+    if get("updatedDescription"):
+        changes.append("Description updated")
+
+    # Trashed
+    trashed = get("trashed")
+    if trashed is True:
+        changes.append("Issue trashed")
+    elif trashed is False:
+        changes.append("Issue restored from trash")
+
+    # Auto-archived/closed
+    if get("autoArchived"):
+        changes.append("Auto-archived")
+    if get("autoClosed"):
+        changes.append("Auto-closed")
+
+    if not changes:
+        return ""
+
+    return HISTORY_ENTRY_TEMPLATE.format(timestamp=created_at, actor=actor_name, changes="\n  ".join(changes))
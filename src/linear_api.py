@@ -1,20 +1,85 @@
 """Linear API client for fetching teams, initiatives, and issues."""
 
+import functools
 import os
 import sys
-from typing import Optional
+import time
+from typing import Optional, Sequence
 
 import click
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.cache import cached_ttl
 
 load_dotenv()
 
 LINEAR_API_URL = "https://api.linear.app/graphql"
 
-
+# Transient failures (rate limits, gateway errors) are retried with exponential backoff
+# instead of aborting the run; all queries are reads, so POST is safe to retry
+MAX_RETRIES = 5
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Shared session so paginated requests reuse pooled keep-alive connections
+# instead of opening a new TLS connection per call
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_SECONDS,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,  # Hand the last response to raise_for_status()
+    ),
+))
+
+# Selections shared by the team/initiative listing queries, so combined and single
+# queries return the same shape
+TEAM_NODE_FIELDS = "id, key, name"
+TEAMS_SELECTION = f"teams {{ nodes {{ {TEAM_NODE_FIELDS} }} }}"
+INITIATIVES_SELECTION = "initiatives(first: 100) { nodes { id, name, slugId } }"
+
+# Fields selected for each issue history entry: only what format_history_entry displays
+HISTORY_NODE_FIELDS = """
+    createdAt
+    updatedDescription
+    fromTitle
+    toTitle
+    fromPriority
+    toPriority
+    fromEstimate
+    toEstimate
+    fromDueDate
+    toDueDate
+    trashed
+    autoArchived
+    autoClosed
+    actor { name }
+    botActor { name }
+    fromState { name }
+    toState { name }
+    fromAssignee { name }
+    toAssignee { name }
+    fromCycle { name }
+    toCycle { name }
+    fromProject { name }
+    toProject { name }
+    fromParent { identifier }
+    toParent { identifier }
+    fromTeam { key }
+    toTeam { key }
+    addedLabels { name }
+    removedLabels { name }
+"""
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
-    """Get Linear API key from environment."""
+    """Get Linear API key from environment (looked up once per run)."""
     api_key = os.getenv("LINEAR_API_KEY")
     if not api_key:
         click.echo("Error: LINEAR_API_KEY not found in environment or .env file", err=True)
@@ -22,6 +87,17 @@ def get_api_key() -> str:
     return api_key
 
 
+def is_rate_limited(response: requests.Response) -> bool:
+    """Check for Linear's GraphQL rate-limit error, which is returned as HTTP 400 rather than 429."""
+    if response.status_code != 400:
+        return False
+    try:
+        errors = response.json().get("errors") or []
+    except ValueError:
+        return False
+    return any((error.get("extensions") or {}).get("code") == "RATELIMITED" for error in errors)
+
+
 def linear_request(query: str, variables: Optional[dict] = None) -> dict:
     """Make a GraphQL request to Linear API."""
     headers = {
@@ -32,7 +108,11 @@ def linear_request(query: str, variables: Optional[dict] = None) -> dict:
     if variables:
         payload["variables"] = variables
 
-    response = requests.post(LINEAR_API_URL, json=payload, headers=headers)
+    for attempt in range(MAX_RETRIES + 1):
+        response = _session.post(LINEAR_API_URL, json=payload, headers=headers)
+        if attempt == MAX_RETRIES or not is_rate_limited(response):
+            break
+        time.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
     response.raise_for_status()
 
     result = response.json()
@@ -43,46 +123,55 @@ def linear_request(query: str, variables: Optional[dict] = None) -> dict:
     return result.get("data", {})
 
 
+def filter_archived_initiatives(initiatives: list, include_archived: bool = False) -> list:
+    """Drop initiatives marked "[Archive]" in their name unless include_archived is set."""
+    if include_archived:
+        return initiatives
+    return [i for i in initiatives if "[Archive]" not in i.get("name", "")]
+
+
+@cached_ttl()
 def fetch_teams() -> list:
     """Fetch all teams from Linear."""
-    query = """
-    query {
-        teams {
-            nodes { id, key, name }
-        }
-    }
-    """
+    query = f"query {{ {TEAMS_SELECTION} }}"
     return linear_request(query).get("teams", {}).get("nodes", [])
 
 
+@cached_ttl()
 def fetch_all_initiatives(include_archived: bool = False) -> list:
     """Fetch all initiatives from Linear with their slugIds."""
-    query = """
-    query {
-        initiatives(first: 100) {
-            nodes {
-                id
-                name
-                slugId
-            }
-        }
-    }
-    """
+    query = f"query {{ {INITIATIVES_SELECTION} }}"
     initiatives = linear_request(query).get("initiatives", {}).get("nodes", [])
+    return filter_archived_initiatives(initiatives, include_archived)
 
-    if not include_archived:
-        initiatives = [i for i in initiatives if "[Archive]" not in i.get("name", "")]
-
-    return initiatives
 
+@cached_ttl()
+def fetch_teams_and_initiatives(include_archived: bool = False) -> tuple:
+    """Fetch all teams and initiatives in a single GraphQL request.
 
-def fetch_issues_for_team(team_id: str, initiative_slugs: Optional[list] = None, exclude_completed: bool = False) -> list:
+    Returns a tuple of (teams, initiatives), filtered like fetch_teams() and fetch_all_initiatives().
+    """
+    query = f"query {{ {TEAMS_SELECTION} {INITIATIVES_SELECTION} }}"
+    data = linear_request(query)
+    teams = data.get("teams", {}).get("nodes", [])
+    initiatives = filter_archived_initiatives(data.get("initiatives", {}).get("nodes", []), include_archived)
+    return teams, initiatives
+
+
+def fetch_issues_for_team(
+    team_id: str,
+    initiative_slugs: Optional[Sequence[str]] = None,
+    exclude_completed: bool = False,
+    initiatives: Optional[list] = None,
+) -> list:
     """Fetch all issues for a specific team with pagination, optionally filtered by initiatives.
 
     Args:
         team_id: The Linear team ID
-        initiative_slugs: Optional list of initiative slugs to filter by
+        initiative_slugs: Optional list/tuple of initiative slugs to filter by
         exclude_completed: If True, exclude issues with completed status
+        initiatives: Initiatives already fetched by the caller, used to resolve the slugs
+            (fetched here if not given)
     """
     all_issues = []
     end_cursor = None
@@ -90,15 +179,26 @@ def fetch_issues_for_team(team_id: str, initiative_slugs: Optional[list] = None,
     # Build initiative filter set if specified
     initiative_ids = None
     if initiative_slugs:
-        initiatives = fetch_all_initiatives()
+        if initiatives is None:
+            initiatives = fetch_all_initiatives()
         initiative_ids = {i["id"] for i in initiatives if i.get("slugId") in initiative_slugs}
         if not initiative_ids:
             click.echo(f"Warning: No matching initiatives found for slugs: {initiative_slugs}", err=True)
             return []
 
+    # Filter server-side so excluded issues are never transferred or paginated over:
+    # drop cancelled issues (keep: triage, backlog, unstarted, started, completed)
+    excluded_types = ["canceled", "cancelled"]
+    if exclude_completed:
+        excluded_types.append("completed")
+    issue_filter = {"team": {"id": {"eq": team_id}}, "state": {"type": {"nin": excluded_types}}}
+    if initiative_ids:
+        issue_filter["project"] = {"initiatives": {"some": {"id": {"in": sorted(initiative_ids)}}}}
+
+    # Only the fields the spreadsheet writers read (plus id/identifier to key issues by)
     query = """
-    query($teamId: ID!, $after: String) {
-        issues(filter: { team: { id: { eq: $teamId } } }, first: 100, after: $after) {
+    query($filter: IssueFilter!, $after: String) {
+        issues(filter: $filter, first: 100, after: $after) {
             nodes {
                 id
                 identifier
@@ -108,22 +208,11 @@ def fetch_issues_for_team(team_id: str, initiative_slugs: Optional[list] = None,
                 estimate
                 updatedAt
                 assignee { name }
-                state {
-                    name
-                    type
-                }
-                completedAt
-                cycle {
-                    id
-                    name
-                    number
-                    startsAt
-                    endsAt
-                }
+                state { type }
+                cycle { startsAt }
                 project {
-                    id
                     name
-                    initiatives { nodes { id, name, slugId } }
+                    initiatives { nodes { name } }
                 }
             }
             pageInfo { hasNextPage, endCursor }
@@ -133,36 +222,10 @@ def fetch_issues_for_team(team_id: str, initiative_slugs: Optional[list] = None,
 
     has_next_page = True
     while has_next_page:
-        variables = {"teamId": team_id, "after": end_cursor}
+        variables = {"filter": issue_filter, "after": end_cursor}
         data = linear_request(query, variables)
         issues_data = data.get("issues", {})
-        issues = issues_data.get("nodes", [])
-
-        # Filter out cancelled/archived issues (keep: triage, backlog, unstarted, started, completed)
-        excluded_types = {"canceled", "cancelled"}
-        issues = [
-            issue for issue in issues
-            if (issue.get("state") or {}).get("type", "").lower() not in excluded_types
-        ]
-
-        # Filter out completed issues if requested
-        if exclude_completed:
-            issues = [
-                issue for issue in issues
-                if (issue.get("state") or {}).get("type", "").lower() != "completed"
-            ]
-
-        # Filter by initiative if specified
-        if initiative_ids:
-            issues = [
-                issue for issue in issues
-                if any(
-                    init.get("id") in initiative_ids
-                    for init in (issue.get("project") or {}).get("initiatives", {}).get("nodes", [])
-                )
-            ]
-
-        all_issues.extend(issues)
+        all_issues.extend(issues_data.get("nodes", []))
 
         page_info = issues_data.get("pageInfo", {})
         has_next_page = page_info.get("hasNextPage", False)
@@ -171,12 +234,18 @@ def fetch_issues_for_team(team_id: str, initiative_slugs: Optional[list] = None,
     return all_issues
 
 
+@cached_ttl()
 def get_team_by_key(team_key: str) -> Optional[dict]:
-    """Find team by its key."""
-    for team in fetch_teams():
-        if team.get("key", "").upper() == team_key.upper():
-            return team
-    return None
+    """Find team by its key (case-insensitive), letting Linear do the lookup."""
+    query = f"""
+    query($key: String!) {{
+        teams(filter: {{ key: {{ eqIgnoreCase: $key }} }}, first: 1) {{
+            nodes {{ {TEAM_NODE_FIELDS} }}
+        }}
+    }}
+    """
+    teams = linear_request(query, {"key": team_key}).get("teams", {}).get("nodes", [])
+    return teams[0] if teams else None
 
 
 def fetch_issue_by_identifier(identifier: str) -> Optional[dict]:
@@ -211,107 +280,15 @@ def fetch_issue_history(issue_id: str) -> list:
     all_history = []
     end_cursor = None
 
-    query = """
-    query($issueId: String!, $after: String) {
-        issue(id: $issueId) {
-            history(first: 100, after: $after) {
-                nodes {
-                    id
-                    createdAt
-                    updatedDescription
-                    fromTitle
-                    toTitle
-                    fromPriority
-                    toPriority
-                    fromEstimate
-                    toEstimate
-                    fromDueDate
-                    toDueDate
-                    trashed
-                    autoArchived
-                    autoClosed
-                    addedLabelIds
-                    removedLabelIds
-                    actor {
-                        id
-                        name
-                    }
-                    botActor {
-                        id
-                        name
-                    }
-                    fromState {
-                        id
-                        name
-                        type
-                    }
-                    toState {
-                        id
-                        name
-                        type
-                    }
-                    fromAssignee {
-                        id
-                        name
-                    }
-                    toAssignee {
-                        id
-                        name
-                    }
-                    fromCycle {
-                        id
-                        name
-                        number
-                    }
-                    toCycle {
-                        id
-                        name
-                        number
-                    }
-                    fromProject {
-                        id
-                        name
-                    }
-                    toProject {
-                        id
-                        name
-                    }
-                    fromParent {
-                        id
-                        identifier
-                        title
-                    }
-                    toParent {
-                        id
-                        identifier
-                        title
-                    }
-                    fromTeam {
-                        id
-                        key
-                        name
-                    }
-                    toTeam {
-                        id
-                        key
-                        name
-                    }
-                    addedLabels {
-                        id
-                        name
-                    }
-                    removedLabels {
-                        id
-                        name
-                    }
-                }
-                pageInfo {
-                    hasNextPage
-                    endCursor
-                }
-            }
-        }
-    }
+    query = f"""
+    query($issueId: String!, $after: String) {{
+        issue(id: $issueId) {{
+            history(first: 100, after: $after, orderBy: createdAt) {{
+                nodes {{ {HISTORY_NODE_FIELDS} }}
+                pageInfo {{ hasNextPage, endCursor }}
+            }}
+        }}
+    }}
     """
 
     has_next_page = True